@@ -10,6 +10,9 @@
 
 from typing import Set
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 from pathlib import Path
 from os import mkdir, path
 
@@ -17,6 +20,12 @@ BOOKS_LOCATION = 'raw_data/books.csv'
 FILMS_LOCATIONS = ['raw_data/title.basics.tsv',
                    'raw_data/title.ratings.tsv']
 
+BOOKS_USED_COLS = ['authors', 'language_code', 'original_title',
+                   'average_rating', 'ratings_count']
+FILMS_BASICS_COLS = ['tconst', 'titleType', 'originalTitle',
+                     'startYear', 'runtimeMinutes']
+FILMS_RATINGS_COLS = ['tconst', 'averageRating', 'numVotes']
+
 BOOKS_COLS = {'original_title': 'title', 'ratings_count': 'num_votes'}
 FILMS_COLS = {'originalTitle': 'title', 'startYear': 'year',
               'averageRating': 'average_rating', 'numVotes': 'num_votes'}
@@ -37,10 +46,11 @@ def get_books_ratings(location: str) -> pd.DataFrame:
     2         The Invisible Man            7.24      84778
     3  The Island of Dr. Moreau            7.44      60346
     """
-    dataframe = pd.read_csv(location, low_memory=False)
+    dataframe = pd.read_csv(location, usecols=BOOKS_USED_COLS)
 
-    dataframe = dataframe.loc[(dataframe['authors'].str.contains(
-        'H.G. Wells')) & (~dataframe['language_code'].isnull())]
+    dataframe = dataframe.loc[
+        dataframe['authors'].str.contains('H.G. Wells', regex=False, na=False)
+        & dataframe['language_code'].notna()]
 
     # transform rating from 0-5 to 0-10 system
     dataframe['average_rating'] *= 2
@@ -77,21 +87,42 @@ def get_films_ratings(location_1: str, location_2: str, books: Set[str]) -> pd.D
     6         The Invisible Man  2020             7.1     152154
     7         The Invisible Man  2017             3.3        168
     """
-    # read title basics data
-    df_basics = pd.read_csv(location_1, sep='\t', low_memory=False)
-    df_ratings = pd.read_csv(location_2, sep='\t', low_memory=False)
+    # read title basics data as strings, only parsing used columns;
+    # the dataset is not quoted, titles may start with an unclosed '"'
+    basics = pa_csv.read_csv(
+        location_1,
+        parse_options=pa_csv.ParseOptions(delimiter='\t', quote_char=False),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=FILMS_BASICS_COLS,
+            column_types=dict.fromkeys(FILMS_BASICS_COLS, pa.string())))
+
+    # select films for the given books and remove unfilled data
+    # before converting the table to pandas
+    mask = pc.and_(pc.is_in(basics['originalTitle'],
+                            value_set=pa.array(list(books), pa.string())),
+                   pc.equal(basics['titleType'], 'movie'))
+
+    for column in ['startYear', 'runtimeMinutes']:
+        mask = pc.and_(mask, pc.not_equal(basics[column], '\\N'))
 
-    # remove unfilled data
-    df_basics = df_basics.loc[(df_basics['originalTitle'].isin(books))
-                              & (df_basics['titleType'] == 'movie')
-                              & (df_basics['startYear'] != '\\N')
-                              & (df_basics['runtimeMinutes'] != '\\N')]
+    df_basics = basics.filter(mask).to_pandas()
+
+    # read title ratings data
+    df_ratings = pd.read_csv(location_2, sep='\t', engine='pyarrow',
+                             usecols=FILMS_RATINGS_COLS)
+
+    # only keep ratings of selected films
+    df_ratings = df_ratings.loc[df_ratings['tconst'].isin(df_basics['tconst'])]
 
     # merge datasets and remove unused columns
-    merged_df = pd.merge(
-        df_basics[['tconst', 'originalTitle', 'startYear']], df_ratings, on=["tconst"])
+    merged_df = pd.merge(df_basics[['tconst', 'originalTitle', 'startYear']],
+                         df_ratings, on='tconst', how='inner',
+                         validate='one_to_one')
     merged_df.drop(['tconst'], axis=1, inplace=True)
 
+    # years are read as strings because of '\N' placeholders
+    merged_df['startYear'] = merged_df['startYear'].astype('int64')
+
     # rename columns
     merged_df.rename(columns=FILMS_COLS, inplace=True)
 
@@ -111,5 +142,7 @@ def generate_datasets() -> None:
         mkdir('data')
 
     # save datasets
-    books_df.to_csv(Path('data/books.csv'), index=False)
-    films_df.to_csv(Path('data/films.csv'), index=False)
+    books_df.to_parquet(Path('data/books.parquet'), index=False,
+                        compression='zstd')
+    films_df.to_parquet(Path('data/films.parquet'), index=False,
+                        compression='zstd')
@@ -3,10 +3,13 @@
     Functions
     ---------
         print_emotions - print a table of emotions in a book vs a film
+        read_emotions_dataset - read words and rates from a dataset of emotions
+        save_emotion_stats - save a dataset of emotions as a NumPy archive
         get_emotion_stats - transform a dataset of emotions
         get_word_counts - count each word in the file
         calculate_emotion_rates - calculate emotion rates of a dictionary
         get_script_emotions - calculate emotion rates of a file
+        get_scripts_emotions - calculate emotion rates of several files
         get_film_emotions - calculate emotion rates of a film script
         get_book_emotions - calculate emotion rates of a book
 """
@@ -15,13 +18,18 @@
 from typing import Dict, List, Tuple
 from pathlib import Path
 from collections import Counter
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 from os import path
 import pandas as pd
+import numpy as np
 
 
 EMOTIONS = ['disgust', 'surprise', 'neutral',
             'anger', 'sad', 'happy', 'fear']
 EMOTIONS_PATH = Path(__file__).parent / 'data/emotions.csv'
+EMOTIONS_ARCHIVE_PATH = Path(__file__).parent / 'data/emotions.npz'
+PUNCTUATION = '.,!?;:-'
 
 
 def print_emotions(book: str, film: str, book_emotions: List[str],
@@ -42,46 +50,79 @@ def print_emotions(book: str, film: str, book_emotions: List[str],
     BOOK      0.5       0.2      0.3    0.4  0.6    0.7   0.1
     FILM      1.0       0.5      0.7    0.7  1.3    1.5   0.2
     """
-    results = pd.DataFrame(columns=EMOTIONS)
-
-    book_row = {}
-    film_row = {}
-
-    for idx, emotion in enumerate(EMOTIONS):
-        book_row[emotion] = book_emotions[idx]
-        film_row[emotion] = film_emotions[idx]
-
-    results = results.append(pd.Series(book_row, name='BOOK'))
-    results = results.append(pd.Series(film_row, name='FILM'))
+    results = pd.DataFrame([book_emotions, film_emotions],
+                           columns=EMOTIONS, index=['BOOK', 'FILM'])
 
     print()
     print(f'{book} [book] vs {film} [film]')
     print(results)
 
 
-def get_emotion_stats() -> Tuple[float]:
+def read_emotions_dataset() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Read words and their emotion rates from the emotions dataset.
+
+    :return: an array of words and a matrix of emotion rates
+
+    >>> words, rates = read_emotions_dataset()
+    >>> words[:3].tolist()
+    ['ability', 'able', 'abuse']
+    >>> rates.shape
+    (1104, 7)
+    """
+    emotions_df = pd.read_csv(EMOTIONS_PATH)
+
+    # words are followed by a trailing space in the dataset
+    words = emotions_df.iloc[:, 0].str[:-1].to_numpy(dtype=str)
+    rates = emotions_df.iloc[:, 1:].to_numpy(dtype=np.float64)
+
+    return words, rates
+
+
+def save_emotion_stats() -> None:
+    """
+    Save words and emotion rates from the emotions dataset to
+    a NumPy archive, so that they can be loaded without parsing.
+    """
+    words, rates = read_emotions_dataset()
+
+    np.savez_compressed(EMOTIONS_ARCHIVE_PATH, words=words, rates=rates)
+
+
+@lru_cache(maxsize=1)
+def get_emotion_stats() -> Tuple[Dict[str, int], np.ndarray]:
     """
     Transform a dataset of emotions to a dictionary of key-value pairs
-    where keys are words and values are tuples of emotion rates.
+    where keys are words and values are their row indices in a matrix
+    of emotion rates. The dataset is only read once, later calls reuse
+    the result. If the saved archive is up to date, it is used instead
+    of the dataset.
 
-    :return: a dictionary of emotion rates for each word
+    :return: a dictionary of word indices and a matrix of emotion rates
 
-    >>> len(get_emotion_stats())
+    >>> word_indices, rates = get_emotion_stats()
+    >>> len(word_indices)
     1104
-    >>> get_emotion_stats()['sky'][1]
+    >>> rates.shape
+    (1104, 7)
+    >>> rates[word_indices['sky'], 1]
     0.04407295
-    >>> get_emotion_stats()['warning'][0]
+    >>> rates[word_indices['warning'], 0]
     0.005494506
     """
-    emotions_df = pd.read_csv(EMOTIONS_PATH)
+    archive_is_fresh = (path.exists(EMOTIONS_ARCHIVE_PATH)
+                        and path.getmtime(EMOTIONS_ARCHIVE_PATH)
+                        >= path.getmtime(EMOTIONS_PATH))
 
-    emotions = {}
+    if archive_is_fresh:
+        with np.load(EMOTIONS_ARCHIVE_PATH) as archive:
+            words, rates = archive['words'], archive['rates']
+    else:
+        words, rates = read_emotions_dataset()
 
-    for row in emotions_df.iterrows():
-        word = row[1][0][:-1]
-        emotions[word] = tuple(row[1][1:])
+    word_indices = dict(zip(words.tolist(), range(len(words))))
 
-    return emotions
+    return word_indices, rates
 
 
 def get_word_counts(filepath: str) -> Dict[str, int]:
@@ -103,39 +144,43 @@ def get_word_counts(filepath: str) -> Dict[str, int]:
     if not path.exists(filepath):
         return None
 
-    with open(filepath, 'r') as file:
-        words = list(map(lambda word: word.strip('.,!?;:-').lower(),
-                         file.readline().split(' ')))
-        word_counts = dict(Counter(words))
+    # split raw bytes on whitespace, so that the text is never decoded
+    # as a whole and words on separate lines are not glued together
+    with open(filepath, 'rb') as file:
+        tokens = Counter(file.read().split())
+
+    # decode and clean each distinct token once, not per occurrence
+    word_counts = Counter()
+
+    for token, count in tokens.items():
+        word_counts[token.decode().lower().strip(PUNCTUATION)] += count
 
     return word_counts
 
 
 def calculate_emotion_rates(word_counts: Dict[str, int],
-                            emotions: Dict[str, Tuple[float]]) -> List[float]:
+                            emotions: Tuple[Dict[str, int], np.ndarray]
+                            ) -> List[float]:
     """
     Calculate emotion rate for a given dictionary of words.
 
     :param word_counts: a dictionary of words
-    :param emotions: a dictionary of emotion rates for each word
+    :param emotions: word indices and a matrix of emotion rates
     :return: a list of emotion rates
     """
-    emotions_rate = [0] * len(EMOTIONS)
-    total = 0
-
-    for word, count in word_counts.items():
-        if word not in emotions:
-            continue
+    word_indices, rates = emotions
 
-        total += count
+    # keep words in text order so that rates are summed in the same order
+    found = list(filter(word_indices.__contains__, word_counts))
+    total = sum(map(word_counts.__getitem__, found))
 
-        for idx, _ in enumerate(EMOTIONS):
-            emotions_rate[idx] += emotions[word][idx]
+    indices = np.fromiter(map(word_indices.__getitem__, found),
+                          dtype=np.intp, count=len(found))
 
-    for idx, _ in enumerate(emotions_rate):
-        emotions_rate[idx] *= 100 / total
+    # each found word adds its emotion rates once
+    emotions_rate = rates[indices].sum(axis=0) * (100 / total)
 
-    return emotions_rate
+    return emotions_rate.tolist()
 
 
 def get_script_emotions(filepath: str) -> List[float]:
@@ -158,6 +203,26 @@ def get_script_emotions(filepath: str) -> List[float]:
     return calculate_emotion_rates(word_counts, emotions)
 
 
+def get_scripts_emotions(filepaths: List[str]) -> List[List[float]]:
+    """
+    Calculate overall emotion rates of several files filled with words.
+    Files are processed in parallel worker processes.
+
+    :param filepaths: paths to files filled with words
+    :return: a list of emotion rates for each file
+
+    >>> scripts_emotions = get_scripts_emotions([
+    ...     'scripts/The Invisible Man 2017.txt',
+    ...     'books/The Invisible Man.txt'])
+    >>> scripts_emotions[0][0]
+    0.25946562144900015
+    >>> scripts_emotions[1][1]
+    0.42418248937038233
+    """
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(get_script_emotions, filepaths))
+
+
 def get_film_emotions(title: str, year: int) -> List[float]:
     """
     Calculate overall emotion rates of a given film script.
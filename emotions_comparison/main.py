@@ -2,6 +2,8 @@
 
     Functions
     ---------
+        load_books - read the books dataset
+        load_films - read the films dataset
         print_conclusion - print the conclusion about the analysis
         input_until_valid - wait for the user to choose among some values
         get_particular_comparison - get comparison of one book vs one film
@@ -10,8 +12,9 @@
 """
 
 
-from typing import List
+from typing import Container
 from pathlib import Path
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
@@ -25,8 +28,30 @@ or get an analysis based on H.G. Wells\' books (2)?
 
 BAR_WIDTH = 0.35
 
-BOOKS_PATH = Path(__file__).parent / 'data/books.csv'
-FILMS_PATH = Path(__file__).parent / 'data/films.csv'
+BOOKS_PATH = Path(__file__).parent / 'data/books.parquet'
+FILMS_PATH = Path(__file__).parent / 'data/films.parquet'
+
+
+@lru_cache(maxsize=1)
+def load_books() -> pd.DataFrame:
+    """
+    Read the books dataset. The dataset is only read once,
+    later calls return the same dataframe.
+
+    :return: a dataframe with books ratings
+    """
+    return pd.read_parquet(BOOKS_PATH)
+
+
+@lru_cache(maxsize=1)
+def load_films() -> pd.DataFrame:
+    """
+    Read the films dataset. The dataset is only read once,
+    later calls return the same dataframe.
+
+    :return: a dataframe with films ratings
+    """
+    return pd.read_parquet(FILMS_PATH)
 
 
 def print_conclusion() -> None:
@@ -41,12 +66,12 @@ try to make the viewer engaged by causing eccessive emotins, while books focus m
 """)
 
 
-def input_until_valid(valid_vals: List[int], message: str = '') -> int:
+def input_until_valid(valid_vals: Container[int], message: str = '') -> int:
     """
     Let the user choose an integer value among the given valid ones.
     Ask user again until the input is valid.
 
-    :param valid_vals: a list of acceptable values
+    :param valid_vals: a collection of acceptable values
     :param message: a message to print before user prompt
     :return: user's choice
     """
@@ -73,21 +98,20 @@ def get_particular_comparison() -> None:
     Print comparison between that book and film.
     """
     # choose a book title
-    df_books = pd.read_csv(BOOKS_PATH)
-    titles = list(df_books['title'])
+    df_books = load_books()
 
     print('Choose a book from the catalogue:')
 
-    for idx, title in enumerate(titles):
+    for idx, title in enumerate(df_books['title'].to_numpy()):
         print(f'{title} ({idx + 1})')
 
-    valid_choices = {i + 1 for i in range(df_books.shape[0])}
+    valid_choices = range(1, df_books.shape[0] + 1)
 
     chosen_idx = input_until_valid(valid_choices) - 1
     chosen_title = df_books['title'][chosen_idx]
 
     # choose film year
-    df_films = pd.read_csv(FILMS_PATH)
+    df_films = load_films()
 
     df_films = df_films.loc[df_films['title'] == chosen_title]
 
@@ -100,7 +124,7 @@ def get_particular_comparison() -> None:
         for idx, year in enumerate(years):
             print(f'{chosen_title} - {year} ({idx + 1})')
 
-        valid_choices = {i for i, _ in enumerate(years, 1)}
+        valid_choices = range(1, len(years) + 1)
         chosen_year = years[input_until_valid(valid_choices) - 1]
 
     # get emotion rates for book and film
@@ -128,14 +152,20 @@ def get_analysis() -> None:
     """
     Build a bar plot of films and books ratings.
     """
-    df_books = pd.read_csv(BOOKS_PATH)
-    df_films = pd.read_csv(FILMS_PATH)
+    df_books = load_books()
+    df_films = load_films()
+
+    labels = (df_films['title'] + ' ('
+              + df_films['year'].astype(str) + ')').tolist()
 
-    labels = [f'{row[1][0]} ({row[1][1]})' for row in df_films.iterrows()]
+    # match each film with the rating of its book
+    df_ratings = df_films.merge(
+        df_books[['title', 'average_rating']].rename(
+            columns={'average_rating': 'book_rating'}),
+        on='title', how='left', validate='many_to_one')
 
-    books_means = [df_books.loc[df_books['title'] == title].iloc[0, 1]
-                   for title in df_films['title']]
-    films_means = list(df_films['average_rating'])
+    books_means = df_ratings['book_rating'].to_numpy()
+    films_means = df_ratings['average_rating'].to_numpy()
 
     x_loc = np.arange(len(labels))   # labels locations
 